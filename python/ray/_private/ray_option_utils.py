@@ -113,6 +113,9 @@ def issubclass_safe(obj: Any, cls_: type) -> bool:
 
 _task_only_options = {
     "max_calls": _counting_option("max_calls", False, default_value=0),
+    # Whether repeated calls with the same hashable arguments return the
+    # ObjectRefs of the first call instead of submitting a new task.
+    "memoize": Option(bool, default_value=False),
     # Normal tasks may be retried on failure this many times.
     # TODO(swang): Allow this to be set globally for an application.
     "max_retries": _counting_option(
@@ -1,4 +1,6 @@
+import io
 import logging
+import sys
 import threading
 import traceback
 
@@ -6,6 +8,8 @@ import ray._private.utils
 import ray.cloudpickle as pickle
 from ray._private import ray_constants
 from ray._private.gcs_utils import ErrorType
+from ray.cloudpickle.cloudpickle import _PICKLE_BY_VALUE_MODULES
+from ray.cloudpickle.compat import Pickler as _BasePickler
 from ray._raylet import (
     MessagePackSerializedObject,
     MessagePackSerializer,
@@ -41,6 +45,7 @@ from ray.exceptions import (
     WorkerCrashedError,
 )
 from ray.util import serialization_addons
+from ray.util.serialization import PreSerialized
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +54,109 @@ class DeserializationError(Exception):
     pass
 
 
+class _PickleByValue(Exception):
+    """Raised to fall back to cloudpickle from the base pickler."""
+
+
+def _pickle_by_value(obj):
+    raise _PickleByValue
+
+
+# A flat dispatch table for the base pickler, which maps each type with a
+# reducer in cloudpickle's dispatch table to `_pickle_by_value`. This makes the
+# base pickler fall back to cloudpickle before running any of these reducers
+# (e.g., Ray's reducers and the ones registered with "register_serializer"),
+# so that they only ever run once, with cloudpickle. The dispatch table is a
+# ChainMap, which is slow to look up from the C pickler. Only the types matter,
+# so the table is rebuilt when the types in one of the chained maps changed or
+# a reducer was (un)registered through a serialization context.
+_flat_dispatch_table = None
+_flat_dispatch_table_key = None
+
+# Importable types whose values were found to contain objects that cloudpickle
+# pickles differently. Values of these types go straight to cloudpickle, so
+# that they are not pickled twice every time.
+_by_value_types = set()
+
+
+def _get_flat_dispatch_table():
+    global _flat_dispatch_table, _flat_dispatch_table_key
+    dispatch_table = pickle.CloudPickler.dispatch_table
+    key = tuple(tuple(m) for m in dispatch_table.maps)
+    if key != _flat_dispatch_table_key:
+        _flat_dispatch_table = dict.fromkeys(dispatch_table, _pickle_by_value)
+        _flat_dispatch_table_key = key
+    return _flat_dispatch_table
+
+
+def _invalidate_flat_dispatch_table():
+    global _flat_dispatch_table_key
+    _flat_dispatch_table_key = None
+
+
+def _is_importable(cls):
+    """Whether a class is pickled by reference to its module by cloudpickle.
+
+    Classes defined in "__main__" are pickled by value, since "__main__" on the
+    worker is a different module.
+    """
+    module_name = getattr(cls, "__module__", None)
+    if module_name is None or module_name == "__main__":
+        return False
+    module = sys.modules.get(module_name)
+    return module is not None and getattr(module, cls.__name__, None) is cls
+
+
+def _dumps_by_reference(value, buffer_callback):
+    """Pickle a value with the base pickler if it pickles everything by reference.
+
+    cloudpickle calls back into Python for every object it pickles to detect
+    functions and classes that must be pickled by value, which makes it much
+    slower than the base pickler for, e.g., lists of dataclasses. For values
+    whose functions and classes are all importable and that contain no objects
+    with a custom reducer, the base pickler produces the same result.
+
+    Args:
+        value: The value to pickle.
+        buffer_callback: Called with each out-of-band buffer.
+
+    Returns:
+        The in-band pickled data, or None if the value has to be pickled with
+        cloudpickle.
+    """
+    if _PICKLE_BY_VALUE_MODULES:
+        return None
+    items = value if type(value) in (list, tuple) else (value,)
+    dispatch_table = _get_flat_dispatch_table()
+    for item in items:
+        cls = type(item)
+        if (
+            cls in dispatch_table
+            or cls in _by_value_types
+            or not _is_importable(cls)
+        ):
+            return None
+    f = io.BytesIO()
+    pickler = _BasePickler(f, protocol=5, buffer_callback=buffer_callback)
+    pickler.dispatch_table = dispatch_table
+    try:
+        pickler.dump(value)
+        inband = f.getvalue()
+        # A nested function or class from "__main__" was pickled by reference.
+        # This may also match a string, which only costs a fallback.
+        if b"__main__" in inband:
+            raise _PickleByValue
+    except Exception:
+        # E.g., the value contains a lambda, a locally defined class or an
+        # object with a custom reducer. Builtin types aren't remembered, since
+        # that would disable the fast path for e.g. all lists.
+        for item in items:
+            if type(item).__module__ != "builtins":
+                _by_value_types.add(type(item))
+        return None
+    return inband
+
+
 def _object_ref_deserializer(binary, call_site, owner_address, object_status):
     # NOTE(suquark): This function should be a global function so
     # cloudpickle can access it directly. Otherwise cloudpickle
@@ -125,9 +233,11 @@ class SerializationContext:
 
     def _register_cloudpickle_reducer(self, cls, reducer):
         pickle.CloudPickler.dispatch[cls] = reducer
+        _invalidate_flat_dispatch_table()
 
     def _unregister_cloudpickle_reducer(self, cls):
         pickle.CloudPickler.dispatch.pop(cls, None)
+        _invalidate_flat_dispatch_table()
 
     def _register_cloudpickle_serializer(
         self, cls, custom_serializer, custom_deserializer
@@ -137,6 +247,7 @@ class SerializationContext:
 
         # construct a reducer
         pickle.CloudPickler.dispatch[cls] = _CloudPicklerReducer
+        _invalidate_flat_dispatch_table()
 
     def is_in_band_serialization(self):
         return getattr(self._thread_local, "in_band", False)
@@ -365,9 +476,15 @@ class SerializationContext:
         # TODO(swang): Check that contained_object_refs is empty.
         try:
             self.set_in_band_serialization()
-            inband = pickle.dumps(
-                value, protocol=5, buffer_callback=writer.buffer_callback
-            )
+            buffers = []
+            inband = _dumps_by_reference(value, buffers.append)
+            if inband is None:
+                inband = pickle.dumps(
+                    value, protocol=5, buffer_callback=writer.buffer_callback
+                )
+            else:
+                for buffer in buffers:
+                    writer.buffer_callback(buffer)
         except Exception as e:
             self.get_and_clear_contained_object_refs()
             raise e
@@ -429,5 +546,7 @@ class SerializationContext:
             # use a special metadata to indicate it's raw binary. So
             # that this object can also be read by Java.
             return RawSerializedObject(value)
+        elif isinstance(value, PreSerialized):
+            return value._serialize(self)
         else:
             return self._serialize_to_msgpack(value)
@@ -1,6 +1,7 @@
 import inspect
 import logging
 from inspect import Parameter
+from typing import Optional, Set, Tuple
 
 from ray._private.inspect_util import is_cython
 
@@ -13,6 +14,11 @@ logger = logging.getLogger(__name__)
 # synced.
 DUMMY_TYPE = b"__RAY_DUMMY__"
 
+# The maximum number of argument shapes remembered by `flatten_args` in a
+# `validated_arg_shapes` set. This bounds the set for functions that accept
+# arbitrary keyword arguments.
+MAX_VALIDATED_ARG_SHAPES = 128
+
 
 def get_signature(func):
     """Get signature parameters.
@@ -78,7 +84,12 @@ def extract_signature(func, ignore_first=False):
     return signature_parameters
 
 
-def flatten_args(signature_parameters: list, args, kwargs):
+def flatten_args(
+    signature_parameters: list,
+    args,
+    kwargs,
+    validated_arg_shapes: Optional[Set[Tuple[int, Tuple[str, ...]]]] = None,
+):
     """Validates the arguments against the signature and flattens them.
 
     The flat list representation is a serializable format for arguments.
@@ -94,6 +105,11 @@ def flatten_args(signature_parameters: list, args, kwargs):
             `extract_signature`.
         args: The non-keyword arguments passed into the function.
         kwargs: The keyword arguments passed into the function.
+        validated_arg_shapes: An optional set of argument shapes, i.e., the
+            number of non-keyword arguments and the sorted keyword names,
+            that are known to fit in the signature. Whether arguments fit
+            only depends on their shape, so arguments with a shape in this
+            set are not validated again. Newly validated shapes are added.
 
     Returns:
         List of args and kwargs. Non-keyword arguments are prefixed
@@ -107,11 +123,20 @@ def flatten_args(signature_parameters: list, args, kwargs):
         [None, 1, None, 2, None, 3, "a", 4]
     """
 
-    reconstructed_signature = inspect.Signature(parameters=signature_parameters)
-    try:
-        reconstructed_signature.bind(*args, **kwargs)
-    except TypeError as exc:  # capture a friendlier stacktrace
-        raise TypeError(str(exc)) from None
+    arg_shape = None
+    if validated_arg_shapes is not None:
+        arg_shape = (len(args), tuple(sorted(kwargs)))
+    if arg_shape is None or arg_shape not in validated_arg_shapes:
+        reconstructed_signature = inspect.Signature(parameters=signature_parameters)
+        try:
+            reconstructed_signature.bind(*args, **kwargs)
+        except TypeError as exc:  # capture a friendlier stacktrace
+            raise TypeError(str(exc)) from None
+        if (
+            arg_shape is not None
+            and len(validated_arg_shapes) < MAX_VALIDATED_ARG_SHAPES
+        ):
+            validated_arg_shapes.add(arg_shape)
     list_args = []
     for arg in args:
         list_args += [DUMMY_TYPE, arg]
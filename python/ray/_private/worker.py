@@ -2764,6 +2764,7 @@ def remote(
     max_restarts: int = Undefined,
     max_task_retries: int = Undefined,
     max_retries: int = Undefined,
+    memoize: bool = Undefined,
     runtime_env: Dict[str, Any] = Undefined,
     retry_exceptions: bool = Undefined,
     scheduling_strategy: Union[
@@ -2869,6 +2870,13 @@ def remote(*args, **kwargs):
             crashes unexpectedly. The minimum valid value is 0,
             the default is 4 (default), and a value of -1 indicates
             infinite retries.
+        memoize: Only for *remote functions*. If True, calling the remote
+            function again with the same hashable arguments returns the
+            ObjectRefs of the earlier call instead of submitting a new task.
+            This should only be used for pure functions whose arguments are
+            not mutated. The ObjectRefs of the last 1000 distinct calls are
+            kept, which keeps their values in the object store. Calls with
+            unhashable arguments are never memoized. The default is False.
         runtime_env (Dict[str, Any]): Specifies the runtime environment for
             this actor or task and its children. See
             :ref:`runtime-environments` for detailed documentation. This API is
@@ -1,8 +1,12 @@
 import inspect
+import itertools
 import logging
 import os
 import uuid
+import weakref
+from collections import OrderedDict, namedtuple
 from functools import wraps
+from typing import Any, Dict
 
 import ray._private.signature
 from ray import Language
@@ -10,6 +14,7 @@ from ray import cloudpickle as pickle
 from ray import cross_language
 from ray._private import ray_option_utils
 from ray._private.client_mode_hook import (
+    RAY_CLIENT_MODE_ATTR,
     client_mode_convert_function,
     client_mode_should_convert,
 )
@@ -31,6 +36,86 @@ logger = logging.getLogger(__name__)
 _task_launch_hook = None
 
 
+class _PickledFunction:
+    """The pickled bytes and descriptor of an exported remote function."""
+
+    __slots__ = ("pickled_function", "function_descriptor", "__weakref__")
+
+    def __init__(
+        self, pickled_function: bytes, function_descriptor: PythonFunctionDescriptor
+    ):
+        self.pickled_function = pickled_function
+        self.function_descriptor = function_descriptor
+
+
+# The pickled function of each remote function, keyed by the function's uuid
+# and the session and job it was exported to. This lets a re-export within the
+# same session and job (e.g., of a deserialized copy of a remote function
+# handle) skip pickling the function again. The entries are only referenced by
+# the remote functions that exported them, so an entry goes away along with
+# the last remote function that uses it.
+_PICKLE_CACHE = weakref.WeakValueDictionary()
+
+# The slots that are not pickled along with a remote function. The memoized
+# ObjectRefs in particular must not be shipped to (and pinned by) other tasks.
+_TRANSIENT_SLOTS = frozenset(["_pickle_cache_entry", "_memo_cache"])
+
+# The task options that determine the resources required by a task.
+_ResourceOptions = namedtuple(
+    "_ResourceOptions",
+    [
+        "num_cpus",
+        "num_gpus",
+        "memory",
+        "object_store_memory",
+        "resources",
+        "accelerator_type",
+    ],
+)
+
+# The maximum number of distinct calls memoized per remote function when the
+# "memoize" option is set.
+_MEMOIZE_CACHE_SIZE = 1000
+
+# Remote function uuids are a random per-process prefix followed by a
+# counter, which is much cheaper than calling `uuid.uuid4()` for each of them.
+_UUID_COUNTER = itertools.count()
+_UUID_PREFIX = uuid.uuid4().bytes[:8]
+
+
+def _reset_uuid_prefix():
+    # A forked child must not reuse the uuids of its parent.
+    global _UUID_PREFIX
+    _UUID_PREFIX = uuid.uuid4().bytes[:8]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_prefix)
+
+
+def _new_uuid() -> uuid.UUID:
+    return uuid.UUID(bytes=_UUID_PREFIX + next(_UUID_COUNTER).to_bytes(8, "big"))
+
+
+def _freeze_option(value):
+    """Convert a task option value into a hashable value for a memo key.
+
+    Dicts (e.g., runtime envs and resources) and lists are converted to tuples.
+    Other unhashable values make the memo key unhashable, and the call is not
+    memoized.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_option(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_option(v) for v in value)
+    return value
+
+
+# A shared empty dict passed in place of a fresh `{}` on the task submission
+# path. It must never be mutated.
+_EMPTY_DICT: Dict[str, Any] = {}
+
+
 @PublicAPI
 class RemoteFunction:
     """A remote function.
@@ -69,6 +154,11 @@ class RemoteFunction:
             return the resulting ObjectRefs. For an example, see
             "test_decorated_function" in "python/ray/tests/test_basic.py".
         _function_signature: The function signature.
+        _validated_arg_shapes: The shapes of the arguments (the number of
+            positional arguments and the sorted keyword names) that are known
+            to fit in the function signature.
+        _pickle_cache_entry: The entry of `_PICKLE_CACHE` for the last export of
+            this remote function, which keeps the entry alive.
         _last_export_session_and_job: A pair of the last exported session
             and job to help us to know whether this function was exported.
             This is an imperfect mechanism used to determine if we need to
@@ -77,8 +167,52 @@ class RemoteFunction:
             different workers.
         _scheduling_strategy: Strategy about how to schedule
             this remote function.
+        _memoize: Whether repeated calls with the same hashable arguments
+            return the ObjectRefs of the first call.
+        _memo_cache: The least recently used cache of memoized calls, mapping
+            the call arguments to the ObjectRefs they returned (as a tuple if
+            they were a list) and whether they were a list.
+        _task_option_defaults: The default values of all task options except
+            "max_calls" and "max_retries", which are handled separately.
+        _default_resource_options: The resource options this remote function
+            is decorated with.
+        _default_resources: The resource requirements computed from
+            `_default_resource_options`. This is not defined until the remote
+            function is first invoked with its default resource options.
+        _serialized_runtime_env_info: The serialized runtime env info of
+            `_runtime_env`. This is not defined until the remote function is
+            first invoked with its default runtime environment.
     """
 
+    # Remote functions are created in large numbers, so their attributes are
+    # kept in slots rather than in a per-instance dict. The task options are
+    # stored as "_" + option name by "__init__", except for the private
+    # options, whose attribute names would be mangled as slots.
+    __slots__ = (
+        "_language",
+        "_function",
+        "_function_name",
+        "_function_descriptor",
+        "_is_cross_language",
+        "_decorator",
+        "_function_signature",
+        "_validated_arg_shapes",
+        "_last_export_session_and_job",
+        "_uuid",
+        "_pickled_function",
+        "_pickle_cache_entry",
+        "_memo_cache",
+        "_default_options",
+        "_task_option_defaults",
+        "_default_resource_options",
+        "_default_resources",
+        "_serialized_runtime_env_info",
+        "remote",
+        RAY_CLIENT_MODE_ATTR,
+    ) + tuple(
+        "_" + k for k in ray_option_utils.task_options if not k.startswith("_")
+    )
+
     def __init__(
         self,
         language,
@@ -99,7 +233,8 @@ class RemoteFunction:
         # E.g., actors uses "__ray_metadata__" to collect options, we can so something
         # similar for remote functions.
         for k, v in ray_option_utils.task_options.items():
-            setattr(self, "_" + k, task_options.get(k, v.default_value))
+            if not k.startswith("_"):
+                setattr(self, "_" + k, task_options.get(k, v.default_value))
         self._runtime_env = parse_runtime_env(self._runtime_env)
         if "runtime_env" in self._default_options:
             self._default_options["runtime_env"] = self._runtime_env
@@ -113,8 +248,27 @@ class RemoteFunction:
         self._function_signature = ray._private.signature.extract_signature(
             self._function
         )
+        self._validated_arg_shapes = set()
         self._last_export_session_and_job = None
-        self._uuid = uuid.uuid4()
+        self._pickle_cache_entry = None
+        self._uuid = _new_uuid()
+        self._memo_cache = OrderedDict()
+
+        # Resolve the option defaults once, so that "_remote" doesn't need to
+        # walk "ray_option_utils.task_options" on every submission.
+        self._task_option_defaults = {
+            k: v.default_value
+            for k, v in ray_option_utils.task_options.items()
+            if k not in ("max_calls", "max_retries")
+        }
+        self._default_resource_options = _ResourceOptions(
+            *(
+                task_options.get(k, self._task_option_defaults[k])
+                for k in _ResourceOptions._fields
+            )
+        )
+        self._default_resources = None
+        self._serialized_runtime_env_info = None
 
         # Override task.remote's signature and docstring
         @wraps(function)
@@ -123,6 +277,25 @@ class RemoteFunction:
 
         self.remote = _remote_proxy
 
+    def __getstate__(self):
+        state = {}
+        for name in self.__slots__:
+            if name in _TRANSIENT_SLOTS:
+                continue
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                # The slot hasn't been set yet, e.g., "_pickled_function"
+                # before the remote function is first exported.
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._pickle_cache_entry = None
+        self._memo_cache = OrderedDict()
+
     def __call__(self, *args, **kwargs):
         raise TypeError(
             "Remote functions cannot be called directly. Instead "
@@ -169,6 +342,9 @@ class RemoteFunction:
                 in beta and may change before becoming stable.
             retry_exceptions: This specifies whether application-level errors
                 should be retried up to max_retries times.
+            memoize: If True, calling the remote function again with the same
+                hashable arguments returns the ObjectRefs of the earlier call
+                instead of submitting a new task.
             scheduling_strategy: Strategy about how to
                 schedule a remote function or actor. Possible values are
                 None: ray will figure out the scheduling strategy to use, it
@@ -195,8 +371,6 @@ class RemoteFunction:
             g = f.options(num_gpus=2)
         """
 
-        func_cls = self
-
         # override original options
         default_options = self._default_options.copy()
         # max_calls could not be used in ".options()", we should remove it before
@@ -211,21 +385,7 @@ class RemoteFunction:
                 updated_options["runtime_env"]
             )
 
-        class FuncWrapper:
-            def remote(self, *args, **kwargs):
-                return func_cls._remote(args=args, kwargs=kwargs, **updated_options)
-
-            @DeveloperAPI
-            def bind(self, *args, **kwargs):
-                """
-                For Ray DAG building that creates static graph from decorated
-                class or functions.
-                """
-                from ray.dag.function_node import FunctionNode
-
-                return FunctionNode(func_cls._function, args, kwargs, updated_options)
-
-        return FuncWrapper()
+        return _RemoteFunctionWithOptions(self, updated_options)
 
     @_tracing_task_invocation
     def _remote(self, args=None, kwargs=None, **task_options):
@@ -245,9 +405,6 @@ class RemoteFunction:
             not self._is_cross_language
             and self._last_export_session_and_job != worker.current_session_and_job
         ):
-            self._function_descriptor = PythonFunctionDescriptor.from_function(
-                self._function, self._uuid
-            )
             # There is an interesting question here. If the remote function is
             # used by a subsequent driver (in the same script), should the
             # second driver pickle the function again? If yes, then the remote
@@ -256,42 +413,66 @@ class RemoteFunction:
             # behavior of the remote function in the second driver to be
             # independent of whether or not the function was invoked by the
             # first driver. This is an argument for repickling the function,
-            # which we do here.
-            try:
-                self._pickled_function = pickle.dumps(self._function)
-            except TypeError as e:
-                msg = (
-                    "Could not serialize the function "
-                    f"{self._function_descriptor.repr}. Check "
-                    "https://docs.ray.io/en/master/ray-core/objects/serialization.html#troubleshooting "  # noqa
-                    "for more information."
+            # which we do here. The pickled function is only reused within
+            # the same session and job.
+            if self._last_export_session_and_job is not None:
+                # The entry of the previous session or job can't be reused.
+                _PICKLE_CACHE.pop(
+                    (self._uuid, self._last_export_session_and_job), None
+                )
+            cache_key = (self._uuid, worker.current_session_and_job)
+            entry = _PICKLE_CACHE.get(cache_key)
+            if entry is not None:
+                self._pickled_function = entry.pickled_function
+                self._function_descriptor = entry.function_descriptor
+            else:
+                self._function_descriptor = PythonFunctionDescriptor.from_function(
+                    self._function, self._uuid
+                )
+                try:
+                    self._pickled_function = pickle.dumps(self._function)
+                except TypeError as e:
+                    msg = (
+                        "Could not serialize the function "
+                        f"{self._function_descriptor.repr}. Check "
+                        "https://docs.ray.io/en/master/ray-core/objects/serialization.html#troubleshooting "  # noqa
+                        "for more information."
+                    )
+                    raise TypeError(msg) from e
+                entry = _PickledFunction(
+                    self._pickled_function, self._function_descriptor
                 )
-                raise TypeError(msg) from e
+                _PICKLE_CACHE[cache_key] = entry
+            self._pickle_cache_entry = entry
 
             self._last_export_session_and_job = worker.current_session_and_job
             worker.function_actor_manager.export(self)
+            # ObjectRefs from a previous session or job are no longer valid.
+            self._memo_cache.clear()
 
         kwargs = {} if kwargs is None else kwargs
         args = [] if args is None else args
 
         # fill task required options
-        for k, v in ray_option_utils.task_options.items():
-            if k == "max_retries":
-                # TODO(swang): We need to override max_retries here because the default
-                # value gets set at Ray import time. Ideally, we should allow setting
-                # default values from env vars for other options too.
-                v.default_value = os.environ.get(
-                    "RAY_TASK_MAX_RETRIES", v.default_value
-                )
-                v.default_value = int(v.default_value)
-            task_options[k] = task_options.get(k, v.default_value)
-        # "max_calls" already takes effects and should not apply again.
-        # Remove the default value here.
-        task_options.pop("max_calls", None)
+        # TODO(swang): We need to override max_retries here because the default
+        # value gets set at Ray import time. Ideally, we should allow setting
+        # default values from env vars for other options too.
+        max_retries_option = ray_option_utils.task_options["max_retries"]
+        max_retries_option.default_value = int(
+            os.environ.get("RAY_TASK_MAX_RETRIES", max_retries_option.default_value)
+        )
+        call_options = task_options
+        # "max_calls" already takes effects and should not apply again, so it
+        # is not part of the defaults.
+        task_options = {
+            **self._task_option_defaults,
+            "max_retries": max_retries_option.default_value,
+            **task_options,
+        }
 
         # TODO(suquark): cleanup these fields
         name = task_options["name"]
-        runtime_env = parse_runtime_env(task_options["runtime_env"])
+        runtime_env = task_options["runtime_env"]
         placement_group = task_options["placement_group"]
         placement_group_bundle_index = task_options["placement_group_bundle_index"]
         placement_group_capture_child_tasks = task_options[
@@ -307,12 +488,60 @@ class RemoteFunction:
         else:
             retry_exception_allowlist = None
 
+        memo_key = None
+        if task_options["memoize"] and not self._is_cross_language:
+            try:
+                kwargs_items = tuple(sorted(kwargs.items()))
+                # Calls with options that differ from the decorated ones (e.g.,
+                # through ".options()") may run differently, e.g., in another
+                # runtime env, so they are memoized apart.
+                option_overrides = tuple(
+                    (k, _freeze_option(v))
+                    for k, v in sorted(call_options.items())
+                    if k not in self._default_options or self._default_options[k] != v
+                )
+                # Include the argument types like "functools.lru_cache" with
+                # "typed=True" does, so that e.g. 1 and 1.0 are memoized apart.
+                memo_key = (
+                    tuple(args),
+                    kwargs_items,
+                    tuple(type(arg) for arg in args),
+                    tuple(type(value) for _, value in kwargs_items),
+                    option_overrides,
+                )
+                hash(memo_key)
+            except TypeError:
+                # Calls with unhashable arguments are not memoized.
+                memo_key = None
+            else:
+                memoized = self._memo_cache.get(memo_key)
+                if memoized is not None:
+                    try:
+                        self._memo_cache.move_to_end(memo_key)
+                    except KeyError:
+                        # The entry was evicted concurrently.
+                        pass
+                    object_refs, is_list = memoized
+                    return list(object_refs) if is_list else object_refs
+
         if scheduling_strategy is None or not isinstance(
             scheduling_strategy, PlacementGroupSchedulingStrategy
         ):
             _warn_if_using_deprecated_placement_group(task_options, 4)
 
-        resources = ray._private.utils.resources_from_ray_options(task_options)
+        resource_options = _ResourceOptions(
+            *(task_options[k] for k in _ResourceOptions._fields)
+        )
+        if resource_options == self._default_resource_options:
+            # Most invocations use the decorated resource options, so reuse the
+            # resources computed for them.
+            if self._default_resources is None:
+                self._default_resources = (
+                    ray._private.utils.resources_from_ray_options(task_options)
+                )
+            resources = self._default_resources
+        else:
+            resources = ray._private.utils.resources_from_ray_options(task_options)
 
         if scheduling_strategy is None or isinstance(
             scheduling_strategy, PlacementGroupSchedulingStrategy
@@ -334,7 +563,7 @@ class RemoteFunction:
                 placement_group_capture_child_tasks,
                 placement_group_bundle_index,
                 resources,
-                {},  # no placement_resources for tasks
+                _EMPTY_DICT,  # no placement_resources for tasks
                 self._function_descriptor.function_name,
                 placement_group=placement_group,
             )
@@ -348,12 +577,23 @@ class RemoteFunction:
                 scheduling_strategy = "DEFAULT"
 
         serialized_runtime_env_info = None
-        if runtime_env is not None:
-            serialized_runtime_env_info = get_runtime_env_info(
-                runtime_env,
-                is_job_runtime_env=False,
-                serialize=True,
-            )
+        # Empty runtime envs are treated as not set, like in "parse_runtime_env".
+        if runtime_env:
+            if (
+                runtime_env is self._runtime_env
+                and self._serialized_runtime_env_info is not None
+            ):
+                # The runtime env of the decorator was already parsed in
+                # "__init__", and its info only needs to be serialized once.
+                serialized_runtime_env_info = self._serialized_runtime_env_info
+            else:
+                serialized_runtime_env_info = get_runtime_env_info(
+                    parse_runtime_env(runtime_env),
+                    is_job_runtime_env=False,
+                    serialize=True,
+                )
+                if runtime_env is self._runtime_env:
+                    self._serialized_runtime_env_info = serialized_runtime_env_info
 
         if _task_launch_hook:
             _task_launch_hook(self._function_descriptor, resources, scheduling_strategy)
@@ -365,7 +605,10 @@ class RemoteFunction:
                 list_args = []
             else:
                 list_args = ray._private.signature.flatten_args(
-                    self._function_signature, args, kwargs
+                    self._function_signature,
+                    args,
+                    kwargs,
+                    validated_arg_shapes=self._validated_arg_shapes,
                 )
 
             if worker.mode == ray._private.worker.LOCAL_MODE:
@@ -397,7 +640,17 @@ class RemoteFunction:
         if self._decorator is not None:
             invocation = self._decorator(invocation)
 
-        return invocation(args, kwargs)
+        object_refs = invocation(args, kwargs)
+        if memo_key is not None and object_refs is not None:
+            # A list of ObjectRefs (for "num_returns" > 1) is stored as a tuple
+            # and copied on each hit, so that callers can't modify the entry.
+            if isinstance(object_refs, list):
+                self._memo_cache[memo_key] = (tuple(object_refs), True)
+            else:
+                self._memo_cache[memo_key] = (object_refs, False)
+            if len(self._memo_cache) > _MEMOIZE_CACHE_SIZE:
+                self._memo_cache.popitem(last=False)
+        return object_refs
 
     @DeveloperAPI
     def bind(self, *args, **kwargs):
@@ -409,3 +662,35 @@ class RemoteFunction:
         from ray.dag.function_node import FunctionNode
 
         return FunctionNode(self._function, args, kwargs, self._default_options)
+
+
+class _RemoteFunctionWithOptions:
+    """A remote function with overridden options, returned by `.options()`.
+
+    Attributes:
+        _remote_function: The RemoteFunction whose options are overridden.
+        _options: The task options to invoke the remote function with.
+    """
+
+    __slots__ = ("_remote_function", "_options")
+
+    def __init__(self, remote_function, options):
+        self._remote_function = remote_function
+        self._options = options
+
+    def remote(self, *args, **kwargs):
+        return self._remote_function._remote(
+            args=args, kwargs=kwargs, **self._options
+        )
+
+    @DeveloperAPI
+    def bind(self, *args, **kwargs):
+        """
+        For Ray DAG building that creates static graph from decorated
+        class or functions.
+        """
+        from ray.dag.function_node import FunctionNode
+
+        return FunctionNode(
+            self._remote_function._function, args, kwargs, self._options
+        )
@@ -1,4 +1,5 @@
 # coding: utf-8
+import gc
 import logging
 import os
 import pickle
@@ -351,10 +352,7 @@ def test_options():
 
     f2 = foo.options(num_cpus=1, num_gpus=1, **mock_options(a=11, c=3))
 
-    # TODO(suquark): The current implementation of `.options()` is so bad that we
-    # cannot even access its options from outside. Here we hack the closures to
-    # achieve our goal. Need futher efforts to clean up the tech debt.
-    assert f2.remote.__closure__[1].cell_contents == {
+    assert f2._options == {
         "_metadata": {"namespace": {"a": 11, "b": 2, "c": 3}},
         "num_cpus": 1,
         "num_gpus": 1,
@@ -366,7 +364,7 @@ def test_options():
 
     f3 = foo.options(num_cpus=1, num_gpus=1, **mock_options2(a=11, c=3))
 
-    assert f3.remote.__closure__[1].cell_contents == {
+    assert f3._options == {
         "_metadata": {"namespace": {"a": 1, "b": 2}, "namespace2": {"a": 11, "c": 3}},
         "num_cpus": 1,
         "num_gpus": 1,
@@ -751,6 +749,74 @@ def test_keyword_args(ray_start_shared_local_modes):
     assert ray.get(f3.remote(4)) == 4
 
 
+def test_flatten_args_validated_arg_shapes(monkeypatch):
+    import inspect
+
+    from ray._private import signature
+
+    def f(x, y=0):
+        return
+
+    params = signature.extract_signature(f)
+    validated_arg_shapes = set()
+    assert signature.flatten_args(
+        params, [1], {"y": 2}, validated_arg_shapes=validated_arg_shapes
+    ) == [signature.DUMMY_TYPE, 1, "y", 2]
+    assert validated_arg_shapes == {(1, ("y",))}
+
+    # Arguments of a new shape are still validated after another shape is cached.
+    with pytest.raises(TypeError):
+        signature.flatten_args(
+            params, [1, 2, 3], {}, validated_arg_shapes=validated_arg_shapes
+        )
+    with pytest.raises(TypeError):
+        signature.flatten_args(
+            params, [1], {"z": 2}, validated_arg_shapes=validated_arg_shapes
+        )
+    assert validated_arg_shapes == {(1, ("y",))}
+
+    # Arguments of a cached shape skip "Signature.bind".
+    num_binds = 0
+    bind = inspect.Signature.bind
+
+    def counting_bind(self, *args, **kwargs):
+        nonlocal num_binds
+        num_binds += 1
+        return bind(self, *args, **kwargs)
+
+    monkeypatch.setattr(inspect.Signature, "bind", counting_bind)
+    assert signature.flatten_args(
+        params, ["a"], {"y": "b"}, validated_arg_shapes=validated_arg_shapes
+    ) == [signature.DUMMY_TYPE, "a", "y", "b"]
+    assert num_binds == 0
+    signature.flatten_args(
+        params, [1, 2], {}, validated_arg_shapes=validated_arg_shapes
+    )
+    assert num_binds == 1
+    signature.flatten_args(
+        params, [1, 2], {}, validated_arg_shapes=validated_arg_shapes
+    )
+    assert num_binds == 1
+
+    # The set stops growing once it holds "MAX_VALIDATED_ARG_SHAPES" shapes.
+    def g(**kwargs):
+        return
+
+    params = signature.extract_signature(g)
+    validated_arg_shapes = set()
+    for i in range(signature.MAX_VALIDATED_ARG_SHAPES + 10):
+        signature.flatten_args(
+            params, [], {f"k{i}": i}, validated_arg_shapes=validated_arg_shapes
+        )
+    assert len(validated_arg_shapes) == signature.MAX_VALIDATED_ARG_SHAPES
+    num_binds = 0
+    signature.flatten_args(
+        params, [], {"uncached": 0}, validated_arg_shapes=validated_arg_shapes
+    )
+    assert num_binds == 1
+    assert len(validated_arg_shapes) == signature.MAX_VALIDATED_ARG_SHAPES
+
+
 def test_args_starkwargs(ray_start_shared_local_modes):
     def starkwargs(a, b, **kwargs):
         return a, b, kwargs
@@ -836,6 +902,108 @@ def test_oversized_function(ray_start_shared_local_modes):
         Actor.remote()
 
 
+@pytest.mark.skipif(client_test_enabled(), reason="internal api")
+def test_pickled_function_reused_on_reexport(ray_start_shared_local_modes):
+    @ray.remote
+    def f():
+        return 1
+
+    assert ray.get(f.remote()) == 1
+    pickled_function = f._pickled_function
+
+    # Re-exporting within the same session and job reuses the pickled function.
+    f._last_export_session_and_job = None
+    assert ray.get(f.remote()) == 1
+    assert f._pickled_function is pickled_function
+
+
+@pytest.mark.skipif(client_test_enabled(), reason="internal api")
+def test_pickle_cache_entry_released(ray_start_shared_local_modes):
+    @ray.remote
+    def f():
+        return 1
+
+    assert ray.get(f.remote()) == 1
+    worker = ray._private.worker.global_worker
+    cache_key = (f._uuid, worker.current_session_and_job)
+    assert cache_key in ray.remote_function._PICKLE_CACHE
+
+    # The cached pickled function goes away along with the remote function.
+    del f
+    gc.collect()
+    assert cache_key not in ray.remote_function._PICKLE_CACHE
+
+
+@pytest.mark.skipif(client_test_enabled(), reason="internal api")
+def test_remote_function_slots(ray_start_shared_local_modes):
+    @ray.remote(num_returns=2)
+    def f():
+        return 1, 2
+
+    assert not hasattr(f, "__dict__")
+
+    # The state of a remote function survives pickling, including the
+    # attributes that are only set once it's exported.
+    assert ray.get(f.remote()) == [1, 2]
+    g = ray.cloudpickle.loads(ray.cloudpickle.dumps(f))
+    assert g._num_returns == 2
+    assert g._pickled_function == f._pickled_function
+    assert ray.get(g.remote()) == [1, 2]
+
+
+@pytest.mark.skipif(client_test_enabled(), reason="internal api")
+def test_memoize(ray_start_shared_local_modes):
+    @ray.remote(memoize=True)
+    def f(x, y=0):
+        return x + y
+
+    ref = f.remote(1, y=2)
+    assert ray.get(ref) == 3
+    assert f.remote(1, y=2) is ref
+    assert f.remote(1, y=3) is not ref
+    assert f.options(memoize=False).remote(1, y=2) is not ref
+
+    # Equal arguments of different types are memoized apart.
+    assert f.remote(1.0, y=2) is not ref
+    assert f.remote(1, y=True) is not ref
+
+    # Calls with different options are memoized apart.
+    env_f = f.options(runtime_env={"env_vars": {"A": "1"}})
+    env_ref = env_f.remote(1, y=2)
+    assert env_ref is not ref
+    assert env_f.remote(1, y=2) is env_ref
+    other_env_f = f.options(runtime_env={"env_vars": {"A": "2"}})
+    assert other_env_f.remote(1, y=2) is not env_ref
+    assert f.options(name="f2").remote(1, y=2) is not ref
+    cpu_ref = f.options(num_cpus=0.5).remote(1, y=2)
+    assert cpu_ref is not ref
+    assert f.options(num_cpus=0.5).remote(1, y=2) is cpu_ref
+
+    # Callers can't modify the memoized ObjectRefs of a call.
+    @ray.remote(memoize=True, num_returns=2)
+    def g(x):
+        return x, x
+
+    refs = g.remote(1)
+    refs.pop()
+    assert len(g.remote(1)) == 2
+    assert g.remote(1)[0] is refs[0]
+
+    # The memoized calls are not pickled along with the remote function.
+    assert len(ray.cloudpickle.loads(ray.cloudpickle.dumps(f))._memo_cache) == 0
+
+    # Calls with unhashable arguments are not memoized.
+    ref = f.remote([1], y=[2])
+    assert ray.get(ref) == [1, 2]
+    assert f.remote([1], y=[2]) is not ref
+
+    # Only the most recent calls are memoized.
+    for i in range(ray.remote_function._MEMOIZE_CACHE_SIZE + 1):
+        f.remote(i)
+    assert len(f._memo_cache) == ray.remote_function._MEMOIZE_CACHE_SIZE
+    assert (0,) not in (key[0] for key in f._memo_cache)
+
+
 def test_args_stars_after(ray_start_shared_local_modes):
     def star_args_after(a="hello", b="heo", *args, **kwargs):
         return a, b, args, kwargs
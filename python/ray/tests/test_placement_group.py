@@ -512,6 +512,32 @@ def test_object_store_memory_deprecation_warning(ray_start_regular_shared):
     )
 
 
+def test_empty_placement_group_is_shared():
+    import pickle
+
+    from ray.util.placement_group import PlacementGroup
+
+    pg = PlacementGroup.empty()
+    assert pg.is_empty
+    assert pg.bundle_cache is None
+    assert PlacementGroup.empty() is pg
+    assert pickle.loads(pickle.dumps(pg)) is pg
+
+    # A caller can't leak state to the other callers of the shared instance.
+    with pytest.raises(AttributeError):
+        pg.bundle_cache = [{"CPU": 1}]
+    with pytest.raises(AttributeError):
+        pg.id = None
+    with pytest.raises(AttributeError):
+        pg.other = 1
+    with pytest.raises(AttributeError):
+        del pg.bundle_cache
+    other_pg = PlacementGroup.empty()
+    assert other_pg.id.is_nil()
+    assert other_pg.bundle_cache is None
+    assert not hasattr(other_pg, "other")
+
+
 if __name__ == "__main__":
     import os
 
@@ -1,5 +1,7 @@
 # coding: utf-8
 import collections
+import copyreg
+import dataclasses
 import io
 import logging
 import re
@@ -651,6 +653,110 @@ def test_recursive_resolve(ray_start_shared_local_modes):
     assert ray.get(ref) == 42
 
 
+@dataclasses.dataclass
+class _Point:
+    x: object
+    y: int
+
+
+@dataclasses.dataclass
+class _Box:
+    x: object
+
+
+class _Counted:
+    pass
+
+
+def test_serialization_by_reference(ray_start_shared_local_modes):
+    from ray._private.serialization import _dumps_by_reference
+
+    class LocalPoint:
+        pass
+
+    point = _Point(1, 2)
+    inband = _dumps_by_reference([point], lambda buffer: None)
+    assert ray.cloudpickle.loads(inband) == [point]
+
+    # Values with functions or classes that must be pickled by value fall back
+    # to cloudpickle.
+    assert _dumps_by_reference([lambda: 1], lambda buffer: None) is None
+    assert _dumps_by_reference([LocalPoint()], lambda buffer: None) is None
+    assert _dumps_by_reference([_Point(LocalPoint(), 2)], lambda b: None) is None
+    assert ray.get(ray.put(_Point(LocalPoint, 2))).x.__name__ == "LocalPoint"
+
+    # The custom reducers of Ray are still applied.
+    ref = ray.put(3)
+    assert ray.get(ray.get(ray.put(_Point(ref, 2))).x) == 3
+    assert ray.get(ray.put([point, np.arange(10)]))[1].sum() == 45
+
+    # Types whose values had to fall back go straight to cloudpickle afterwards.
+    assert _dumps_by_reference([_Box(1)], lambda buffer: None) is not None
+    assert _dumps_by_reference([_Box(LocalPoint())], lambda buffer: None) is None
+    assert _dumps_by_reference([_Box(1)], lambda buffer: None) is None
+
+    # Custom reducers never run on the fast path, so they run only once even if
+    # the value falls back to cloudpickle.
+    calls = []
+
+    def serializer(obj):
+        calls.append(obj)
+        return 1
+
+    ray.util.register_serializer(
+        _Counted, serializer=serializer, deserializer=lambda _: _Counted()
+    )
+    try:
+        value = ray.get(ray.put([point, _Point(_Counted(), 2)]))
+        assert isinstance(value[1].x, _Counted)
+        assert len(calls) == 1
+    finally:
+        ray.util.deregister_serializer(_Counted)
+
+    # Reducers registered with copyreg directly are picked up as well.
+    copyreg.pickle(_Counted, lambda obj: (_Counted, ()))
+    try:
+        assert _dumps_by_reference([_Counted()], lambda buffer: None) is None
+    finally:
+        del copyreg.dispatch_table[_Counted]
+    assert _dumps_by_reference([_Counted()], lambda buffer: None) is not None
+
+
+def test_pre_serialized(ray_start_shared_local_modes):
+    from ray.util.serialization import PreSerialized
+
+    @ray.remote
+    def f(x):
+        return x
+
+    value = {"a": np.arange(10), "b": "b"}
+    arg = PreSerialized(value)
+    for result in ray.get([f.remote(arg) for _ in range(3)]):
+        assert result.keys() == value.keys()
+        assert np.array_equal(result["a"], value["a"])
+
+    # The value is serialized only once per serialization context.
+    context = ray._private.worker.global_worker.get_serialization_context()
+    assert arg._serialize(context) is arg._serialize(context)
+    assert ray.get(ray.put(arg))["b"] == "b"
+
+    # A nested PreSerialized is serialized as its value.
+    assert ray.get(f.remote([arg]))[0]["b"] == "b"
+
+    # ObjectRefs in the value are passed to each task that reuses the
+    # serialized value.
+    @ray.remote
+    def get_ref(x):
+        return ray.get(x["ref"])
+
+    ref = ray.put(np.arange(10))
+    arg = PreSerialized({"ref": ref})
+    assert ref in arg._serialize(context).contained_object_refs
+    del ref
+    for result in ray.get([get_ref.remote(arg) for _ in range(3)]):
+        assert np.array_equal(result, np.arange(10))
+
+
 def test_serialization_before_init(shutdown_only):
     """This test checks if serializers registered before initializing Ray
     works after initialization."""
@@ -17,7 +17,11 @@ from ray.util.placement_group import (
     placement_group_table,
     remove_placement_group,
 )
-from ray.util.serialization import deregister_serializer, register_serializer
+from ray.util.serialization import (
+    PreSerialized,
+    deregister_serializer,
+    register_serializer,
+)
 
 
 @PublicAPI(stability="beta")
@@ -62,6 +66,7 @@ __all__ = [
     "collective",
     "connect",
     "disconnect",
+    "PreSerialized",
     "register_serializer",
     "deregister_serializer",
     "list_named_actors",
@@ -35,7 +35,7 @@ class PlacementGroup:
 
     @staticmethod
     def empty() -> "PlacementGroup":
-        return PlacementGroup(PlacementGroupID.nil())
+        return _EMPTY_PLACEMENT_GROUP
 
     def __init__(
         self,
@@ -104,6 +104,30 @@ class PlacementGroup:
             self.bundle_cache = _get_bundle_cache(self.id)
 
 
+class _EmptyPlacementGroup(PlacementGroup):
+    """The placement group returned by `PlacementGroup.empty()`.
+
+    A single instance is shared by all callers, so its attributes can't be set:
+    otherwise, a caller could leak state (e.g., a bundle cache) to the others.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, "id", PlacementGroupID.nil())
+        object.__setattr__(self, "bundle_cache", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Cannot set {name!r} of the empty placement group.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Cannot delete {name!r} of the empty placement group.")
+
+    def __reduce__(self):
+        return PlacementGroup.empty, ()
+
+
+_EMPTY_PLACEMENT_GROUP = _EmptyPlacementGroup()
+
+
 @client_mode_wrap
 def _call_placement_group_ready(pg_id: PlacementGroupID, timeout_seconds: int) -> bool:
     worker = ray._private.worker.global_worker
@@ -1,3 +1,5 @@
+from typing import Any
+
 import ray
 import ray.cloudpickle as pickle
 from ray.util.annotations import DeveloperAPI, PublicAPI
@@ -33,6 +35,61 @@ def deregister_serializer(cls: type):
     context._unregister_cloudpickle_reducer(cls)
 
 
+def _unwrap_pre_serialized(value):
+    return value
+
+
+@PublicAPI(stability="alpha")
+class PreSerialized:
+    """A value that Ray serializes only once, however often it's passed.
+
+    Wrapping a task or actor argument (or a value passed to ``ray.put``) in
+    ``PreSerialized`` makes Ray serialize the value on first use and reuse the
+    serialized bytes afterwards. The task receives the wrapped value, not the
+    wrapper. This saves serializing an argument again for each task when the
+    same argument is passed to many tasks.
+
+    Mutating the value after its first use gives undefined results. The
+    serialized value keeps references to the value's out-of-band buffers
+    (e.g., of NumPy arrays), which are copied again for each task, while the
+    rest of the value is only serialized once. Only ``PreSerialized`` objects
+    passed directly are cached: when nested in another argument, the value is
+    serialized along with that argument.
+
+    Examples:
+        >>> import ray
+        >>> from ray.util.serialization import PreSerialized
+        >>> @ray.remote # doctest: +SKIP
+        ... def f(x): # doctest: +SKIP
+        ...     return len(x) # doctest: +SKIP
+        >>> arg = PreSerialized(list(range(1000))) # doctest: +SKIP
+        >>> ray.get([f.remote(arg) for _ in range(100)]) # doctest: +SKIP
+
+    Args:
+        value: The value to serialize.
+    """
+
+    __slots__ = ("value", "_cache")
+
+    def __init__(self, value: Any):
+        self.value = value
+        # A pair of the serialization context and the value serialized with
+        # it, or None if the value hasn't been serialized yet.
+        self._cache = None
+
+    def _serialize(self, context):
+        cache = self._cache
+        if cache is None or cache[0] is not context:
+            cache = (context, context.serialize(self.value))
+            self._cache = cache
+        return cache[1]
+
+    def __reduce__(self):
+        # Pickling a nested PreSerialized yields its value, as for a
+        # PreSerialized passed directly.
+        return _unwrap_pre_serialized, (self.value,)
+
+
 @DeveloperAPI
 class StandaloneSerializationContext:
     # NOTE(simon): Used for registering custom serializers. We cannot directly
@@ -40,7 +97,10 @@ class StandaloneSerializationContext:
     # make sure to keep the API consistent.
 
     def _unregister_cloudpickle_reducer(self, cls):
+        from ray._private.serialization import _invalidate_flat_dispatch_table
+
         pickle.CloudPickler.dispatch.pop(cls, None)
+        _invalidate_flat_dispatch_table()
 
     def _register_cloudpickle_serializer(
         self, cls, custom_serializer, custom_deserializer
@@ -48,5 +108,8 @@ class StandaloneSerializationContext:
         def _CloudPicklerReducer(obj):
             return custom_deserializer, (custom_serializer(obj),)
 
+        from ray._private.serialization import _invalidate_flat_dispatch_table
+
         # construct a reducer
         pickle.CloudPickler.dispatch[cls] = _CloudPicklerReducer
+        _invalidate_flat_dispatch_table()
@@ -35,8 +35,14 @@ class SoftQ(StochasticSampling):
             framework: One of None, "tf", "torch".
         """
         assert isinstance(action_space, (Discrete, MultiDiscrete))
+        assert temperature > 0.0, "SoftQ `temperature` must be > 0.0!"
         super().__init__(action_space, framework=framework, **kwargs)
         self.temperature = temperature
+        # Scale the model outputs by the reciprocal of the temperature, which
+        # is computed only once.
+        self._inv_temperature = 1.0 / temperature
+        # The action distribution class expected for the framework.
+        self._dist_cls = TorchCategorical if framework == "torch" else Categorical
 
     @override(StochasticSampling)
     def get_exploration_action(
@@ -47,10 +53,16 @@ class SoftQ(StochasticSampling):
         explore: bool = True,
     ):
         cls = type(action_distribution)
-        assert cls in [Categorical, TorchCategorical]
+        assert cls is self._dist_cls
         # Re-create the action distribution with the correct temperature
-        # applied.
-        dist = cls(action_distribution.inputs, self.model, temperature=self.temperature)
+        # applied. With a temperature of 1.0, it would be identical to the
+        # given distribution.
+        # Note: The inputs are scaled out of place, as they are the model
+        # outputs the policy also returns (as SampleBatch.ACTION_DIST_INPUTS).
+        if self.temperature == 1.0:
+            dist = action_distribution
+        else:
+            dist = cls(action_distribution.inputs * self._inv_temperature, self.model)
         # Delegate to super method.
         return super().get_exploration_action(
             input_dict=input_dict, action_distribution=dist, timestep=timestep, explore=explore